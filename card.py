@@ -1,5 +1,6 @@
-from typing import Tuple, List, Any, cast
+from typing import Tuple, List, Any, Mapping, Type, cast
 from enum import Enum
+from types import MappingProxyType
 import sys
 
 
@@ -11,10 +12,22 @@ class Suit(str, Enum):  # as a subclass of Enum, it makes Suit class immutable a
 
 
 class Card:
+    # Cards are shared between decks (see CARD_POOL), so attributes are only set once, in __init__(), and can't be
+    # reassigned or deleted afterwards
+    __slots__ = ("suit", "rank", "hard", "soft")
+
     def __init__(self, rank: str, suit: str) -> None:
-        self.suit = suit
-        self.rank = rank
-        self.hard, self.soft = self._points()
+        object.__setattr__(self, "suit", suit)
+        object.__setattr__(self, "rank", rank)
+        hard, soft = self._points()
+        object.__setattr__(self, "hard", hard)
+        object.__setattr__(self, "soft", soft)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def _points(self) -> Tuple[int, int]:
         return int(self.rank), int(self.rank)
@@ -25,6 +38,15 @@ class Card:
     def __str__(self) -> str:
         return f"{self.rank}{self.suit}"
 
+    def __eq__(self, other: Any) -> bool:
+        return (
+            self.suit == cast(Card, other).suit
+            and self.rank == cast(Card, other).rank
+        )
+
+    def __hash__(self) -> int:
+        return (hash(self.suit) + 4 * hash(self.rank)) % sys.hash_info.modulus
+
     def __format__(self, format_spec: str) -> str:
         if format_spec == "":
             return str(self)
@@ -35,34 +57,57 @@ class Card:
 
 
 class AceCard(Card):
+    __slots__ = ()
+
     def _points(self) -> Tuple[int, int]:
         return 1, 11
 
 
 class FaceCard(Card):
+    __slots__ = ()
+
     def _points(self) -> Tuple[int, int]:
         return 10, 10
 
 
+# Rank lookups are built once at import time, rather than as a fresh dict literal on every call. MappingProxyType gives
+# a read-only view, so the tables can be shared freely. The special ranks are only spelled out here; the other tables
+# are derived from this one.
+RANK_CLASS: Mapping[int, Tuple[Type[Card], str]] = MappingProxyType({
+    1: (AceCard, "A"),
+    **{rank: (Card, str(rank)) for rank in range(2, 11)},
+    11: (FaceCard, "J"),
+    12: (FaceCard, "Q"),
+    13: (FaceCard, "K"),
+})
+RANK_NAME: Mapping[int, str] = MappingProxyType({rank: name for rank, (_, name) in RANK_CLASS.items()})
+FACE_NAME: Mapping[int, str] = MappingProxyType(
+    {rank: name for rank, (class_, name) in RANK_CLASS.items() if class_ is FaceCard}
+)
+
+
 def card(rank: int, suit: Suit) -> Card:
-    if rank == 1:
-        return AceCard("A", suit)
-    elif 2 <= rank < 11:
-        return Card(str(rank), suit)
-    elif 11 <= rank < 14:
-        name = {11: "J", 12: "Q", 13: "K"}[rank]
-        return FaceCard(name, suit)
-    raise Exception("Design Failure")
+    if rank not in RANK_CLASS:
+        raise Exception("Design Failure")
+    class_, name = RANK_CLASS[rank]
+    return class_(name, suit)
 
 
 class Card2:
+    __slots__ = ("rank", "suit", "hard", "soft")
     insure = False
 
     def __init__(self, rank: str, suit: "Suit", hard: int, soft: int) -> None:
-        self.rank = rank
-        self.suit = suit
-        self.hard = hard
-        self.soft = soft
+        object.__setattr__(self, "rank", rank)
+        object.__setattr__(self, "suit", suit)
+        object.__setattr__(self, "hard", hard)
+        object.__setattr__(self, "soft", soft)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(suit={self.suit!r}, rank={self.rank!r}"
@@ -89,11 +134,14 @@ class Card2:
 
 
 class NumberCard2(Card2):
+    __slots__ = ()
+
     def __init__(self, rank: int, suit: "Suit") -> None:
         super().__init__(str(rank), suit, rank, rank)
 
 
 class AceCard2(Card2):
+    __slots__ = ()
     insure = True
 
     def __init__(self, rank: int, suit: "Suit") -> None:
@@ -101,137 +149,44 @@ class AceCard2(Card2):
 
 
 class FaceCard2(Card2):
-    def __init__(self, rank: int, suit: "Suit") -> None:
-        rank_str = {11: "J", 12: "Q", 13: "K"}[rank]
-        super().__init__(rank_str, suit, 10, 10)
-
-
-def card2(rank: int, suit: Suit) -> Card2:
-    class_ = {1: AceCard2, 11: FaceCard2, 12: FaceCard2, 13: FaceCard2}.get(
-        rank, NumberCard2
-    )
-    return class_(rank, suit)
+    __slots__ = ()
 
+    def __init__(self, rank: int, suit: "Suit") -> None:
+        super().__init__(FACE_NAME[rank], suit, 10, 10)
 
-def card3(rank: int, suit: Suit) -> Card:
-    if rank == 1:
-        return AceCard("A", suit)
-    elif 2 <= rank < 11:
-        return Card(str(rank), suit)
-    # Replaced a mapping (the previous implementation of card) with elif sequence.
-    # We can always replace a mapping with elif, but the reverse is not necessarily true
-    # This has the advantage of being more consistent than the previous version
-    elif rank == 11:
-        return FaceCard("J", suit)
-    elif rank == 12:
-        return FaceCard("Q", suit)
-    elif rank == 13:
-        return FaceCard("K", suit)
-    else:
-        raise Exception("Rank out of range")
-
-
-# In some cases, we can use mapping instead a chain of elif conditions. It is possible to find conditions that are so
-# complex that a chain of elif conditions is the only sensible way to express them. For simple cases, however, a mapping
-# often works better and can be easier to read.
-def card4(rank: int, suit: Suit) -> Card:
-    # This implementation has a serious deficiency. It lacks the translation from 1 to A, 11 to J, 12 to Q and 13 to K
-    # Some sort of double mapping is required
-    class_ = {1: AceCard, 11: FaceCard, 12: FaceCard, 13: FaceCard}.get(rank, Card)
-    return class_(str(rank), suit)
-
-
-# This is not desirable. It involves a repetition of the sequence of the mapping keys 1, 11, 12, 13. Repetition is bad,
-# because parallel structures never seem to stay that way after the software has been updated or revised.
-def card5(rank: int, suit: Suit) -> Card:
-    class_ = {1: AceCard, 11: FaceCard, 12: FaceCard, 13: FaceCard}.get(rank, Card)
-    rank_str = {1: "A", 11: "J", 12: "Q", 13: "K"}.get(rank, str(rank))
-    return class_(rank_str, suit)
-
-
-def card6(rank: int, suit: Suit) -> Card:
-    class_, rank_str = {
-        1: (AceCard, "A"),
-        11: (FaceCard, "J"),
-        12: (FaceCard, "Q"),
-        13: (FaceCard, "K")
-    }.get(rank, (Card, str(rank),))
-    return class_(rank_str, suit)
-
-
-# In general, partial functions aren't helpful for most object-oriented programming. When building complex objects,
-# it is common to define methods that accept arguments incrementally. Instead of using rank to create a partial
-# function, a more bo object-oriented approach is to use separate methods to set rank and suit
-def card7(rank: int, suit: Suit) -> Card:
-    class_rank = {
-        1: lambda suit: AceCard("A", suit),
-        11: lambda suit: FaceCard("J", suit),
-        12: lambda suit: FaceCard("Q", suit),
-        13: lambda suit: FaceCard("K", suit),
-    }.get(rank, lambda suit: Card(str(rank), suit))
-    return class_rank(suit)
-
-
-class CardFactory:
-    def rank(self, rank: int) -> "CardFactory":
-        self.class_, self.rank_str = {
-            1: (AceCard, "A"),
-            11: (FaceCard, "J"),
-            12: (FaceCard, "Q"),
-            13: (FaceCard, "K"),
-        }.get(rank, (Card, str(rank)))
-        return self
-
-    def suit(self, suit: Suit) -> Card:
-        return self.class_(self.rank_str, suit)
-
-
-class Card3:
-    # due to the lack of __hash__ function, this class is mutable
-    def __init__(self, rank: str, suit: Suit, hard: int, soft: int) -> None:
-        self.rank = rank
-        self.suit = suit
-        self.hard = hard
-        self.soft = soft
 
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(suit={self.suit!r}, rank={self.rank!r}"
+RANK_CLASS2: Mapping[int, Type[Card2]] = MappingProxyType({
+    rank: {AceCard: AceCard2, FaceCard: FaceCard2}.get(class_, NumberCard2)
+    for rank, (class_, _) in RANK_CLASS.items()
+})
 
-    def __str__(self) -> str:
-        return f"{self.__class__.__name__}(suit={self.suit!r}, rank={self.rank!r}"
 
-    def __eq__(self, other: Any) -> bool:
-        return (
-            self.suit == cast(Card3, other).suit
-            and self.rank == cast(Card3, other).rank
-        )
-
-
-class NumberCard3(Card3):
-    def __init__(self, rank: int, suit: Suit) -> None:
-        super().__init__(str(rank), suit, rank, rank)
+def card2(rank: int, suit: Suit) -> Card2:
+    class_ = RANK_CLASS2.get(rank, NumberCard2)
+    return class_(rank, suit)
 
 
-class AceCard3(Card3):
-    def __init__(self, rank: int, suit: "Suit") -> None:
-        super().__init__("A", suit, 1, 11)
+# Ready-made pools of one of each card. Card and Card2 are immutable, so every single-deck Deck can share these
+# instances and only needs to copy and shuffle the tuple.
+CARD_POOL: Tuple[Card, ...] = tuple(card(r + 1, s) for r in range(13) for s in iter(Suit))
+CARD2_POOL: Tuple[Card2, ...] = tuple(card2(r + 1, s) for r in range(13) for s in iter(Suit))
 
 
-class FaceCard3(Card3):
-    def __init__(self, rank: int, suit: Suit) -> None:
-        rank_str = {11: "J", 12: "Q", 13: "K"}[rank]
-        super().__init__(rank_str, suit, 10, 10)
+# The other factory experiments live in card_variants. Dealing a hand never needs them, so they are only imported
+# the first time one of them is looked up on this module (PEP 562).
+_VARIANTS = frozenset({
+    "card3", "card4", "card5", "card6", "card7", "CardFactory",
+    "Card3", "NumberCard3", "AceCard3", "FaceCard3", "card10",
+})
 
 
-def card10(rank: int, suit: Suit) -> Card3:
-    if rank == 1:
-        return AceCard3(rank, suit)
-    elif 2 <= rank < 11:
-        return NumberCard3(rank, suit)
-    elif 11 <= rank < 14:
-        return FaceCard3(rank, suit)
-    else:
-        raise Exception("Rank out of range")
+def __getattr__(name: str) -> Any:
+    if name in _VARIANTS:
+        import card_variants
+        value = getattr(card_variants, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def display_cards(list_of_cards: List[Card]):
@@ -254,3 +209,13 @@ if __name__ == '__main__':
 
     print('test')
 
+    # Sanity checks for the precomputed pools and the lazily loaded variants
+    import deck
+    import card as card_module
+    assert "card_variants" not in sys.modules, "import deck should not load card_variants"
+    assert len({(c.rank, c.suit) for c in card_module.CARD_POOL}) == 52
+    assert len({(c.rank, c.suit) for c in card_module.CARD2_POOL}) == 52
+    from card import card6, CardFactory
+    import card_variants
+    assert card6 is card_variants.card6 and CardFactory is card_variants.CardFactory
+
@@ -1,13 +1,13 @@
 import random
 
-from card import card, card2, Card, Suit, display_cards
+from card import card, Card, Suit, CARD_POOL, CARD2_POOL, display_cards
 
 
 # Wrap: This design pattern surrounds an existing collection definition with a simplified interface. This is an example
 # of the more general Facade design pattern
 class Deck:
     def __init__(self) -> None:
-        self._cards = [card(r + 1, s) for r in range(13) for s in iter(Suit)]
+        self._cards = list(CARD_POOL)
         random.shuffle(self._cards)
 
     # The pop() method of the Deck class delegates to the wrapped list object.
@@ -20,12 +20,13 @@ class Deck:
 # such as delete() and remove(). If these additional features are undesirable, a wrapped object might be a better idea.
 class Deck2(list):
     def __init__(self) -> None:
-        super().__init__(card2(r + 1, s) for r in range(13) for s in iter(Suit))
+        super().__init__(CARD2_POOL)
         random.shuffle(self)
 
 
 class Deck3(list):
     def __init__(self, decks: int = 1) -> None:
+        # A shoe holds separate card objects for each deck, rather than repeats of the shared pool
         super().__init__(
             card(r + 1, s)
             for r in range(13)